@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Generate assets_data.py with base64-embedded 200x200 avatar frames.
+
+Run this after changing any MRT_*.png so the app can build its
+PhotoImages straight from memory instead of decoding the full-size
+PNGs at startup:
+
+    python3 generate_assets.py
+
+Requires Pillow.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+from pathlib import Path
+
+from PIL import Image
+
+APP_DIR = Path(__file__).resolve().parent
+OUTPUT = APP_DIR / "assets_data.py"
+IMAGE_SIZE = 200
+FRAME_FILES = [
+    "MRT_mouth_closed.png",
+    "MRT_mouth_open.png",
+    "MRT_mouth_end_1.png",
+    "MRT_mouth_A_face.png",
+    "MRT_mouth_o_face.png",
+]
+
+
+def encode_frame(path: Path) -> str:
+    with Image.open(path) as src:
+        scaled = src.convert("RGBA").resize((IMAGE_SIZE, IMAGE_SIZE), Image.LANCZOS)
+    buf = io.BytesIO()
+    scaled.save(buf, format="PNG", optimize=True)
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def main() -> None:
+    lines = [
+        '"""Base64 PNG data for the pre-scaled avatar frames.',
+        "",
+        "Generated by generate_assets.py; do not edit by hand.",
+        '"""',
+        "",
+        "FRAME_DATA = {",
+    ]
+    count = 0
+    for filename in FRAME_FILES:
+        path = APP_DIR / filename
+        if not path.exists():
+            continue
+        lines.append(f'    "{path.stem}": "{encode_frame(path)}",')
+        count += 1
+    lines.append("}")
+    OUTPUT.write_text("\n".join(lines) + "\n")
+    print(f"Wrote {OUTPUT.name} with {count} frame(s)")
+
+
+if __name__ == "__main__":
+    main()
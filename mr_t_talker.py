@@ -10,7 +10,10 @@ Behavior:
 
 from __future__ import annotations
 
+import atexit
 import datetime as dt
+import hashlib
+import itertools
 import os
 import random
 import shutil
@@ -20,9 +23,28 @@ import tempfile
 import threading
 import time
 import tkinter as tk
+import wave
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import sounddevice
+except (ImportError, OSError):
+    sounddevice = None
+
+# Pre-scaled frames embedded by generate_assets.py; optional.
+try:
+    from assets_data import FRAME_DATA
+except ImportError:
+    FRAME_DATA = {}
+
 APP_DIR = Path(__file__).resolve().parent
+CACHE_DIR = Path.home() / "Library" / "Caches" / "TalkingT"
 CLOSED_IMAGE = APP_DIR / "MRT_mouth_closed.png"
 OPEN_IMAGE = APP_DIR / "MRT_mouth_open.png"
 END_IMAGE = APP_DIR / "MRT_mouth_end_1.png"
@@ -46,6 +68,8 @@ PHRASES = [
     "Kindness and toughness are not opposites.",
     "Small progress every day beats big plans someday.",
 ]
+# The phrase list is fixed, so encode it once instead of per utterance.
+PHRASES_BYTES = {phrase: phrase.encode("utf-8") for phrase in PHRASES}
 
 SAY_VOICE = "Ralph"
 SAY_SPEECH_RATE = "150"
@@ -78,18 +102,54 @@ MODES = {
 class SpeechEngine:
     def __init__(self) -> None:
         self.say_voice = SAY_VOICE
-        self.piper_bin = shutil.which("piper")
-        self.piper_model = os.environ.get("PIPER_MODEL_PATH", "").strip()
-        self.piper_config = os.environ.get("PIPER_CONFIG_PATH", "").strip()
+        self.piper_bin: str | None = None
+        self.piper_model = ""
+        self.piper_config = ""
+        self._mode: str | None = None
+        self._say_argv = ["/usr/bin/say", "-v", self.say_voice, "-r", SAY_SPEECH_RATE]
+        self._piper_argv: list[str] = []
+        self._config_lock = threading.Lock()
+        self._piper_proc: subprocess.Popen | None = None
+        self._piper_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wav_dir: Path | None = None
+        self._audio_stream = None
+        self._audio_format: tuple[int, int] | None = None
+        atexit.register(self._shutdown)
+
+    def _ensure_configured(self) -> None:
+        """Probe PATH and the environment once, on first use.
+
+        shutil.which walks and stats every PATH entry; deferring it keeps
+        app construction off that cost. _mode is assigned last so the
+        unlocked fast path only sees a fully configured engine.
+        """
+        if self._mode is not None:
+            return
+        with self._config_lock:
+            if self._mode is not None:
+                return
+            self.piper_bin = shutil.which("piper")
+            self.piper_model = os.environ.get("PIPER_MODEL_PATH", "").strip()
+            self.piper_config = os.environ.get("PIPER_CONFIG_PATH", "").strip()
+            if self._piper_ready():
+                self._piper_argv = [self.piper_bin, "--model", self.piper_model]
+                if self.piper_config and Path(self.piper_config).exists():
+                    self._piper_argv.extend(["--config", self.piper_config])
+                self._mode = "piper"
+            else:
+                self._mode = "say"
 
     def description(self) -> str:
-        if self._piper_ready():
+        self._ensure_configured()
+        if self._mode == "piper":
             model_name = Path(self.piper_model).name
             return f"Piper ({model_name})"
         return f"say ({self.say_voice})"
 
     def speak(self, phrase: str) -> None:
-        if self._piper_ready():
+        self._ensure_configured()
+        if self._mode == "piper":
             self._speak_piper(phrase)
             return
         self._speak_say(phrase)
@@ -102,36 +162,229 @@ class SpeechEngine:
         return Path(self.piper_model).exists()
 
     def _speak_say(self, phrase: str) -> None:
+        # close_fds=False keeps CPython on the posix_spawn fast path, which
+        # launches noticeably faster than fork/exec on macOS. Nothing here
+        # holds inheritable fds the children could leak.
         proc = subprocess.Popen(
-            ["/usr/bin/say", "-v", self.say_voice, "-r", SAY_SPEECH_RATE, phrase],
+            self._say_argv + [phrase],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            close_fds=False,
         )
         proc.wait()
 
-    def _speak_piper(self, phrase: str) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            wav_path = tmp.name
+    def _ensure_piper_worker(self) -> subprocess.Popen | None:
+        """Start (or restart) the resident Piper process; None if unavailable."""
+        if self._piper_proc is not None and self._piper_proc.poll() is None:
+            return self._piper_proc
+        if self._mode != "piper":
+            return None
 
-        try:
-            cmd = [self.piper_bin, "--model", self.piper_model, "--output_file", wav_path]
-            if self.piper_config and Path(self.piper_config).exists():
-                cmd.extend(["--config", self.piper_config])
+        if self._wav_dir is None:
+            self._wav_dir = Path(tempfile.mkdtemp(prefix="talkingt_"))
 
-            proc = subprocess.Popen(
+        cmd = self._piper_argv + ["--output_dir", str(self._wav_dir)]
+
+        try:
+            self._piper_proc = subprocess.Popen(
                 cmd,
                 stdin=subprocess.PIPE,
-                stdout=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
                 stderr=subprocess.DEVNULL,
-                text=True,
+                close_fds=False,
             )
-            proc.communicate(phrase)
+        except OSError:
+            self._piper_proc = None
+        return self._piper_proc
+
+    def synthesize_to_wav(self, phrase: str) -> Path | None:
+        """Render a phrase to a WAV via the resident Piper worker, or None."""
+        self._ensure_configured()
+        with self._piper_lock:
+            proc = self._ensure_piper_worker()
+            if proc is None:
+                return None
+
+            data = PHRASES_BYTES.get(phrase) or phrase.encode("utf-8")
+            try:
+                proc.stdin.write(data + b"\n")
+                proc.stdin.flush()
+                line = proc.stdout.readline().decode().strip()
+            except OSError:
+                line = ""
+
+            if not line:
+                # Worker died mid-request; drop it so the next call restarts.
+                self._terminate_worker()
+                return None
+            return Path(line)
+
+    def _wav_cache_dir(self) -> Path:
+        model = Path(self.piper_model)
+        key = hashlib.sha1(f"{model}:{model.stat().st_mtime_ns}".encode()).hexdigest()[:12]
+        return CACHE_DIR / "wav" / key
+
+    def _cached_wav_path(self, phrase: str) -> Path:
+        data = PHRASES_BYTES.get(phrase) or phrase.encode("utf-8")
+        return self._wav_cache_dir() / (hashlib.sha1(data).hexdigest()[:16] + ".wav")
+
+    def cached_wav(self, phrase: str) -> Path | None:
+        """Return the pre-synthesized WAV for a phrase, if one exists."""
+        if self._mode != "piper":
+            return None
+        try:
+            path = self._cached_wav_path(phrase)
+            return path if path.exists() else None
+        except OSError:
+            # Model file vanished mid-session; treat as a cache miss so
+            # _speak_piper's say fallback takes over.
+            return None
+
+    def synthesize_batch(self, phrases: list[str]) -> list[Path]:
+        """Render several phrases through the resident worker into the WAV cache.
+
+        The lock is taken per phrase so a concurrent speak can interleave
+        with a long prewarm instead of waiting behind the whole batch.
+        """
+        self._ensure_configured()
+        produced: list[Path] = []
+        for phrase in phrases:
+            if self._stop.is_set():
+                break
+            with self._piper_lock:
+                proc = self._ensure_piper_worker()
+                if proc is None:
+                    break
+
+                try:
+                    self._wav_cache_dir().mkdir(parents=True, exist_ok=True)
+                except OSError:
+                    break
+
+                data = PHRASES_BYTES.get(phrase) or phrase.encode("utf-8")
+                try:
+                    proc.stdin.write(data + b"\n")
+                    proc.stdin.flush()
+                    line = proc.stdout.readline().decode().strip()
+                except OSError:
+                    line = ""
+                if not line:
+                    self._terminate_worker()
+                    break
+                try:
+                    dest = self._cached_wav_path(phrase)
+                    shutil.move(line, dest)
+                except OSError:
+                    continue
+                produced.append(dest)
+        return produced
+
+    def prewarm_phrase_cache(self, phrases: list[str]) -> None:
+        """Batch-synthesize any phrases missing from the WAV cache."""
+        self._ensure_configured()
+        if self._mode != "piper":
+            return
+        try:
+            missing = [p for p in phrases if not self._cached_wav_path(p).exists()]
+        except OSError:
+            return
+        if missing:
+            self.synthesize_batch(missing)
 
-            if proc.returncode != 0:
-                self._speak_say(phrase)
-                return
+    def request_stop(self) -> None:
+        """Abort in-flight batch work so the app can quit promptly.
+
+        Killing the worker also unblocks a synthesis the batch loop is
+        currently waiting on.
+        """
+        self._stop.set()
+        self._terminate_worker()
+
+    def _terminate_worker(self) -> None:
+        if self._piper_proc is None:
+            return
+        try:
+            self._piper_proc.terminate()
+        except OSError:
+            pass
+        self._piper_proc = None
+
+    def _shutdown(self) -> None:
+        self._stop.set()
+        self._terminate_worker()
+        self._close_audio_stream()
+        if self._wav_dir is not None:
+            shutil.rmtree(self._wav_dir, ignore_errors=True)
+            self._wav_dir = None
+
+    def play_wav(self, wav_path: Path) -> None:
+        if sounddevice is not None and self._play_wav_stream(wav_path):
+            return
+        subprocess.run(
+            ["/usr/bin/afplay", str(wav_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False,
+            close_fds=False,
+        )
+
+    def _ensure_audio_stream(self, rate: int, channels: int):
+        """Return a running PortAudio stream for the given format, reusing
+        the previous one whenever the format matches."""
+        if self._audio_stream is not None and self._audio_format == (rate, channels):
+            return self._audio_stream
+
+        self._close_audio_stream()
+        try:
+            stream = sounddevice.RawOutputStream(samplerate=rate, channels=channels, dtype="int16")
+            stream.start()
+        except Exception:
+            return None
+        self._audio_stream = stream
+        self._audio_format = (rate, channels)
+        return stream
+
+    def _play_wav_stream(self, wav_path: Path) -> bool:
+        """Play a 16-bit PCM WAV through the persistent output stream."""
+        try:
+            with wave.open(str(wav_path), "rb") as wav:
+                if wav.getsampwidth() != 2:
+                    return False
+                stream = self._ensure_audio_stream(wav.getframerate(), wav.getnchannels())
+                if stream is None:
+                    return False
+                while True:
+                    frames = wav.readframes(4096)
+                    if not frames:
+                        break
+                    stream.write(frames)
+        except Exception:
+            return False
+        return True
+
+    def _close_audio_stream(self) -> None:
+        if self._audio_stream is None:
+            return
+        try:
+            self._audio_stream.close()
+        except Exception:
+            pass
+        self._audio_stream = None
+        self._audio_format = None
+
+    def _speak_piper(self, phrase: str) -> None:
+        cached = self.cached_wav(phrase)
+        if cached is not None:
+            self.play_wav(cached)
+            return
+
+        wav_path = self.synthesize_to_wav(phrase)
+        if wav_path is None:
+            self._speak_say(phrase)
+            return
 
-            subprocess.run(["afplay", wav_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        try:
+            self.play_wav(wav_path)
         finally:
             try:
                 os.remove(wav_path)
@@ -150,25 +403,62 @@ class MrTTalker:
         self.speech_thread: threading.Thread | None = None
         self.selected_mode = tk.StringVar(value="Every 10 minutes")
         self.next_fire: dt.datetime | None = None
+        self._fire_job: str | None = None
         self.engine = SpeechEngine()
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        self._prefetched: tuple[str, Future[Path | None]] | None = None
+        self._phrase_deck: list[str] = []
+        self._prefetch_pool.submit(self.engine.prewarm_phrase_cache, PHRASES)
 
         self.closed_img = self._load_scaled_image(CLOSED_IMAGE)
         self.open_img = self._load_scaled_image(OPEN_IMAGE)
         self.end_img = self._load_scaled_image(END_IMAGE) if END_IMAGE.exists() else None
+        # End-pose availability never changes, so bind the stop pose and
+        # its hold time once instead of branching on every utterance.
+        self._stop_pose = self.end_img if self.end_img is not None else self.closed_img
+        self._stop_hold_ms = END_POSE_HOLD_MS if self.end_img is not None else 0
         self.talk_frames = self._load_talk_frames()
-        self.frame_index = 0
+        self._frame_cycle = itertools.cycle(self.talk_frames)
 
         self._build_menu()
         self._build_avatar_window()
         self._reset_schedule()
-        self._scheduler_tick()
         self.root.after(350, self.speak_now)
 
+    def _cached_scaled_path(self, src: Path) -> Path:
+        stat = src.stat()
+        return CACHE_DIR / f"{src.stem}_{IMAGE_SIZE}_{stat.st_mtime_ns}_{stat.st_size}.png"
+
     def _load_scaled_image(self, path: Path) -> tk.PhotoImage:
+        data = FRAME_DATA.get(path.stem)
+        if data:
+            return tk.PhotoImage(data=data)
+
+        cached = self._cached_scaled_path(path)
+        if cached.exists():
+            return tk.PhotoImage(file=str(cached))
+
+        if Image is not None:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with Image.open(path) as src:
+                    src.convert("RGBA").resize(
+                        (IMAGE_SIZE, IMAGE_SIZE), Image.LANCZOS
+                    ).save(cached, format="PNG")
+                return tk.PhotoImage(file=str(cached))
+            except OSError:
+                pass
+
         raw = tk.PhotoImage(file=str(path))
         # 1024 -> approx 200 using integer subsample.
         factor = max(1, round(raw.width() / IMAGE_SIZE))
-        return raw.subsample(factor, factor)
+        scaled = raw.subsample(factor, factor)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            scaled.write(str(cached), format="png")
+        except (OSError, tk.TclError):
+            pass
+        return scaled
 
     def _load_talk_frames(self) -> list[tk.PhotoImage]:
         frames: list[tk.PhotoImage] = [self.open_img]
@@ -196,7 +486,7 @@ class MrTTalker:
         app_menu.add_cascade(label="Schedule", menu=schedule_menu)
 
         app_menu.add_separator()
-        app_menu.add_command(label="Quit", command=self.root.quit)
+        app_menu.add_command(label="Quit", command=self._quit)
 
         menubar.add_cascade(label="Talking T", menu=app_menu)
         self.root.config(menu=menubar)
@@ -210,13 +500,26 @@ class MrTTalker:
 
         self.face_label = tk.Label(self.avatar, image=self.closed_img, bd=0, bg="#e8e8e8")
         self.face_label.pack()
+        # Bound once; the animation callback runs every MOUTH_FLIP_MS.
+        self._set_face = self.face_label.config
 
-    def _place_avatar_upper_right(self) -> None:
         self.root.update_idletasks()
-        screen_w = self.root.winfo_screenwidth()
-        x = max(0, screen_w - IMAGE_SIZE - WINDOW_MARGIN)
-        y = WINDOW_MARGIN
-        self.avatar.geometry(f"{IMAGE_SIZE}x{IMAGE_SIZE}+{x}+{y}")
+        self._avatar_geom: str | None = self._compute_avatar_geometry()
+        self.root.bind("<Configure>", self._invalidate_avatar_geometry)
+
+        # Map once so the window server allocates backing store now rather
+        # than stalling the first speak.
+        self.avatar.geometry(self._avatar_geom)
+        self.avatar.deiconify()
+        self.avatar.update_idletasks()
+        self.avatar.withdraw()
+
+    def _compute_avatar_geometry(self) -> str:
+        x = max(0, self.root.winfo_screenwidth() - IMAGE_SIZE - WINDOW_MARGIN)
+        return f"{IMAGE_SIZE}x{IMAGE_SIZE}+{x}+{WINDOW_MARGIN}"
+
+    def _invalidate_avatar_geometry(self, _event: object = None) -> None:
+        self._avatar_geom = None
 
     def _compute_next_fire(self, now: dt.datetime) -> dt.datetime:
         mode_key = MODES[self.selected_mode.get()]
@@ -235,44 +538,67 @@ class MrTTalker:
         return candidate
 
     def _reset_schedule(self) -> None:
+        # Wall clock picks the target (modes align to wall time); the delta
+        # is computed once here, so a later NTP/DST jump only matters to the
+        # missed-fire re-arm in _stop_animation.
         now = dt.datetime.now()
         self.next_fire = self._compute_next_fire(now)
-
-    def _on_mode_change(self) -> None:
+        delay = (self.next_fire - now).total_seconds()
+        if self._fire_job:
+            self.root.after_cancel(self._fire_job)
+        self._fire_job = self.root.after(max(0, int(delay * 1000)), self._fire)
+        self._prefetch_next_phrase()
+
+    def _fire(self) -> None:
+        self._fire_job = None
+        self.speak_now()
         self._reset_schedule()
 
-    def _scheduler_tick(self) -> None:
-        now = dt.datetime.now()
-        if self.next_fire and now >= self.next_fire and not self.is_speaking:
-            self.speak_now()
-            self.next_fire = self._compute_next_fire(dt.datetime.now())
+    def _next_phrase(self) -> str:
+        """Pop from a shuffled deck so all phrases play before any repeats."""
+        if not self._phrase_deck:
+            self._phrase_deck = random.sample(PHRASES, len(PHRASES))
+        return self._phrase_deck.pop()
+
+    def _prefetch_next_phrase(self) -> None:
+        """Synthesize the next phrase in the background so fires only play."""
+        if self._prefetched is not None:
+            return
+        phrase = self._next_phrase()
+        cached = self.engine.cached_wav(phrase)
+        if cached is not None:
+            future: Future[Path | None] = Future()
+            future.set_result(cached)
+        else:
+            future = self._prefetch_pool.submit(self.engine.synthesize_to_wav, phrase)
+        self._prefetched = (phrase, future)
 
-        self.root.after(500, self._scheduler_tick)
+    def _on_mode_change(self) -> None:
+        self._reset_schedule()
 
     def _show_avatar(self) -> None:
-        self._place_avatar_upper_right()
+        if self._avatar_geom is None:
+            self._avatar_geom = self._compute_avatar_geometry()
+        self.avatar.geometry(self._avatar_geom)
         self.avatar.deiconify()
         self.avatar.lift()
-        self.avatar.attributes("-topmost", True)
 
     def _hide_avatar(self) -> None:
         self.avatar.withdraw()
 
     def _start_animation(self) -> None:
         self.is_speaking = True
-        self.frame_index = 0
         self._show_avatar()
-        self.face_label.config(image=self.closed_img)
+        self._set_face(image=self.closed_img)
         self.animation_job = self.root.after(START_POSE_HOLD_MS, self._animate_mouth)
 
     def _animate_mouth(self) -> None:
-        if not self.is_speaking:
-            self.face_label.config(image=self.closed_img)
+        speaking = self.is_speaking and self.speech_thread is not None and self.speech_thread.is_alive()
+        if not speaking:
+            self._set_face(image=self.closed_img)
             return
 
-        frame = self.talk_frames[self.frame_index % len(self.talk_frames)]
-        self.face_label.config(image=frame)
-        self.frame_index += 1
+        self._set_face(image=next(self._frame_cycle))
         self.animation_job = self.root.after(MOUTH_FLIP_MS, self._animate_mouth)
 
     def _stop_animation(self) -> None:
@@ -280,26 +606,51 @@ class MrTTalker:
         if self.animation_job:
             self.root.after_cancel(self.animation_job)
             self.animation_job = None
-        if self.end_img:
-            self.face_label.config(image=self.end_img)
-            self.root.after(END_POSE_HOLD_MS, self._hide_avatar)
-            return
-
-        self.face_label.config(image=self.closed_img)
-        self._hide_avatar()
+        # A fire can be missed while asleep or speaking; re-arm if it slipped
+        # past. Deliberately wall clock: macOS monotonic time halts during
+        # sleep, so a deadline slept through never passes on that clock.
+        if self.next_fire is not None and dt.datetime.now() >= self.next_fire:
+            self._reset_schedule()
+        self._set_face(image=self._stop_pose)
+        self.root.after(self._stop_hold_ms, self._hide_avatar)
+
+    def _quit(self) -> None:
+        # The prewarm thread is non-daemon and joined at interpreter exit,
+        # so abort it before quitting or a first-launch quit hangs on it.
+        self.engine.request_stop()
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.quit()
 
     def speak_now(self) -> None:
         if self.is_speaking:
             return
 
-        phrase = random.choice(PHRASES)
+        phrase = None
+        wav_path: Path | None = None
+        if self._prefetched is not None and self._prefetched[1].done():
+            phrase, future = self._prefetched
+            self._prefetched = None
+            wav_path = future.result()
+        if phrase is None:
+            phrase = self._next_phrase()
         self._start_animation()
 
         def _run() -> None:
             try:
-                self.engine.speak(phrase)
+                if wav_path is not None:
+                    try:
+                        self.engine.play_wav(wav_path)
+                    finally:
+                        if CACHE_DIR not in wav_path.parents:
+                            try:
+                                os.remove(wav_path)
+                            except OSError:
+                                pass
+                else:
+                    self.engine.speak(phrase)
             finally:
                 self.root.after(0, self._stop_animation)
+                self.root.after(0, self._prefetch_next_phrase)
 
         self.speech_thread = threading.Thread(target=_run, daemon=True)
         self.speech_thread.start()
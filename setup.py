@@ -43,6 +43,10 @@ OPTIONS = {
         "LSMinimumSystemVersion": "12.0",
     },
     "packages": [],
+    "excludes": ["tkinter.test", "unittest", "pydoc_data", "xml", "email"],
+    "optimize": 2,
+    "strip": True,
+    "compressed": True,
 }
 
 setup(